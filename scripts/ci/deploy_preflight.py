@@ -35,7 +35,8 @@ def main() -> int:
     parser.add_argument("--ref", required=True)
     args = parser.parse_args()
 
-    missing = [name for name in REQUIRED_ENV[args.env] if not os.getenv(name)]
+    env = os.environ
+    missing = [name for name in REQUIRED_ENV[args.env] if not env.get(name)]
     if missing:
         print(
             f"Preflight failed: missing required environment variables for {args.env}: {', '.join(missing)}"
@@ -3,29 +3,44 @@
 from __future__ import annotations
 
 import argparse
+import os
 import re
 import sys
 from pathlib import Path
 from typing import Iterable
 
 
-FLOATING_REF_RE = re.compile(r"^\s*uses:\s*[^@\s]+@(main|master)\b", re.IGNORECASE)
+# Matched against lines already stripped of indentation and any "- " list marker.
+FLOATING_REF_RE = re.compile(r"\Auses:\s*[^@\s]+@(main|master)\b", re.IGNORECASE)
 LATEST_EXPO_EAS_RE = re.compile(
-    r"^\s*(expo-version|eas-version|version)\s*:\s*latest\s*$", re.IGNORECASE
+    r"\A(expo-version|eas-version|version)\s*:\s*latest\s*$", re.IGNORECASE
 )
+_FLOATING_KEY_PREFIXES = ("uses", "expo-version", "eas-version", "version")
+_FLOATING_KEY_PREFIX_LEN = max(len(prefix) for prefix in _FLOATING_KEY_PREFIXES)
 TOP_LEVEL_PERMISSIONS_RE = re.compile(r"^permissions:\s*$")
 WRITE_PERMISSION_RE = re.compile(r":\s*write\b", re.IGNORECASE)
+_JOB_HEADER_RE = re.compile(r"^  [A-Za-z0-9_-]+:\s*$")
+_NEEDS_INLINE_RE = re.compile(r"^\s{4}needs:\s*(.*)$")
+_NEEDS_ITEM_RE = re.compile(r"^\s{6}-\s*([A-Za-z0-9_-]+)\s*$")
+_DEPLOY_WORKFLOW_NAME = "ci-cd.yml"
 
 
 def _default_workflow_files(repo_root: Path) -> list[Path]:
     workflows_dir = repo_root / ".github" / "workflows"
-    return sorted([*workflows_dir.glob("*.yml"), *workflows_dir.glob("*.yaml")])
+    if not workflows_dir.is_dir():
+        return []
+    with os.scandir(workflows_dir) as entries:
+        return sorted(
+            workflows_dir / entry.name
+            for entry in entries
+            if entry.name.endswith((".yml", ".yaml")) and entry.is_file()
+        )
 
 
-def _parse_needs(block_lines: list[str]) -> list[str]:
+def _parse_needs(lines: list[str], start: int, end: int) -> list[str]:
     needs: list[str] = []
-    for idx, line in enumerate(block_lines):
-        match = re.match(r"^\s{4}needs:\s*(.*)$", line)
+    for idx in range(start, end):
+        match = _NEEDS_INLINE_RE.match(lines[idx])
         if not match:
             continue
 
@@ -38,10 +53,11 @@ def _parse_needs(block_lines: list[str]) -> list[str]:
                 return [item.strip() for item in inner.split(",") if item.strip()]
             return [inline]
 
-        for subline in block_lines[idx + 1 :]:
-            if re.match(r"^\s{2}[A-Za-z0-9_-]+:\s*$", subline):
+        for sub_idx in range(idx + 1, end):
+            subline = lines[sub_idx]
+            if _JOB_HEADER_RE.match(subline):
                 break
-            list_match = re.match(r"^\s{6}-\s*([A-Za-z0-9_-]+)\s*$", subline)
+            list_match = _NEEDS_ITEM_RE.match(subline)
             if list_match:
                 needs.append(list_match.group(1))
         return needs
@@ -49,22 +65,22 @@ def _parse_needs(block_lines: list[str]) -> list[str]:
     return needs
 
 
-def _extract_job_block(lines: list[str], job_name: str) -> list[str]:
+def _find_job_block(lines: list[str], job_name: str) -> tuple[int, int] | None:
+    """Return the [start, end) line span of a job block, or None if missing."""
+    header_prefix = f"  {job_name}:"
     start = None
     for idx, line in enumerate(lines):
-        if re.match(rf"^\s{{2}}{re.escape(job_name)}:\s*$", line):
+        if line.startswith(header_prefix) and _JOB_HEADER_RE.match(line):
             start = idx
             break
 
     if start is None:
-        return []
+        return None
 
-    block: list[str] = []
-    for line in lines[start:]:
-        if block and re.match(r"^\s{2}[A-Za-z0-9_-]+:\s*$", line):
-            break
-        block.append(line)
-    return block
+    for idx in range(start + 1, len(lines)):
+        if _JOB_HEADER_RE.match(lines[idx]):
+            return start, idx
+    return start, len(lines)
 
 
 def _check_top_level_permissions(
@@ -74,14 +90,23 @@ def _check_top_level_permissions(
         if not TOP_LEVEL_PERMISSIONS_RE.match(line):
             continue
 
-        for block_line in lines[idx + 1 :]:
-            if not block_line.strip():
+        for block_idx in range(idx + 1, len(lines)):
+            block_line = lines[block_idx]
+            stripped = block_line.strip()
+            if not stripped:
                 continue
             if not block_line.startswith(" "):
                 break
-            if "write-all" in block_line:
+            # Commented-out scopes are not granted; don't flag them.
+            if stripped.startswith("#"):
+                continue
+
+            block_line_lower = block_line.lower()
+            if "write" not in block_line_lower:
+                continue
+            if "write-all" in block_line_lower:
                 violations.append(f"{file_path}: top-level permissions uses write-all")
-            if WRITE_PERMISSION_RE.search(block_line):
+            if ":" in block_line and WRITE_PERMISSION_RE.search(block_line):
                 violations.append(
                     f"{file_path}: top-level permissions contains write scope ({block_line.strip()})"
                 )
@@ -92,11 +117,20 @@ def _check_floating_refs(
     file_path: Path, lines: Iterable[str], violations: list[str]
 ) -> None:
     for line_no, line in enumerate(lines, start=1):
-        if FLOATING_REF_RE.match(line):
+        stripped = line.lstrip()
+        if stripped.startswith("- "):
+            stripped = stripped[2:].lstrip()
+        # Most lines are neither `uses:` nor a version key; skip them before
+        # paying for either regex.
+        key = stripped[:_FLOATING_KEY_PREFIX_LEN].lower()
+        if not key.startswith(_FLOATING_KEY_PREFIXES):
+            continue
+
+        if FLOATING_REF_RE.match(stripped):
             violations.append(
                 f"{file_path}:{line_no}: floating ref is forbidden ({line.strip()})"
             )
-        if LATEST_EXPO_EAS_RE.match(line):
+        if LATEST_EXPO_EAS_RE.match(stripped):
             violations.append(
                 f"{file_path}:{line_no}: latest expo/eas version is forbidden ({line.strip()})"
             )
@@ -105,22 +139,27 @@ def _check_floating_refs(
 def _check_deploy_security_gating(
     file_path: Path, lines: list[str], violations: list[str]
 ) -> None:
-    if file_path.name != "ci-cd.yml":
+    if file_path.name != _DEPLOY_WORKFLOW_NAME:
         return
 
     for deploy_job in ("deploy-staging", "deploy-production"):
-        block = _extract_job_block(lines, deploy_job)
-        if not block:
+        span = _find_job_block(lines, deploy_job)
+        if span is None:
             violations.append(f"{file_path}: missing expected job '{deploy_job}'")
             continue
 
-        needs = _parse_needs(block)
+        needs = _parse_needs(lines, *span)
         if "security" not in needs:
             violations.append(
                 f"{file_path}: job '{deploy_job}' must depend on 'security' (current needs: {needs or 'none'})"
             )
 
 
+def _resolve_path(item: str, repo_root: Path) -> Path:
+    path = Path(item)
+    return path if path.is_absolute() else repo_root / path
+
+
 def run_policy_check(files: list[Path]) -> list[str]:
     violations: list[str] = []
 
@@ -129,9 +168,24 @@ def run_policy_check(files: list[Path]) -> list[str]:
             violations.append(f"{file_path}: file does not exist")
             continue
 
-        lines = file_path.read_text(encoding="utf-8").splitlines()
-        _check_floating_refs(file_path, lines, violations)
-        _check_top_level_permissions(file_path, lines, violations)
+        # Substring tests on the raw bytes are far cheaper than per-line regex
+        # scans; files that cannot trip any check are never decoded or split.
+        data = file_path.read_bytes()
+        data_lower = data.lower()
+        has_floating_candidates = b"uses:" in data_lower or b"latest" in data_lower
+        has_permissions = b"permissions:" in data
+        if not (
+            has_floating_candidates
+            or has_permissions
+            or file_path.name == _DEPLOY_WORKFLOW_NAME
+        ):
+            continue
+
+        lines = data.decode("utf-8").splitlines()
+        if has_floating_candidates:
+            _check_floating_refs(file_path, lines, violations)
+        if has_permissions:
+            _check_top_level_permissions(file_path, lines, violations)
         _check_deploy_security_gating(file_path, lines, violations)
 
     return violations
@@ -146,10 +200,7 @@ def main() -> int:
 
     repo_root = Path(__file__).resolve().parents[2]
     if args.files:
-        files = [
-            Path(item).resolve() if Path(item).is_absolute() else (repo_root / item)
-            for item in args.files
-        ]
+        files = [_resolve_path(item, repo_root) for item in args.files]
     else:
         files = _default_workflow_files(repo_root)
 
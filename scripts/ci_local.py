@@ -9,18 +9,85 @@ Usage:
     python3 scripts/ci_local.py           # Run all checks
     python3 scripts/ci_local.py --quick   # Skip native build (faster)
     python3 scripts/ci_local.py --e2e     # Include E2E tests
+    python3 scripts/ci_local.py --fail-fast  # Stop quality checks at first failure
+    python3 scripts/ci_local.py --e2e --e2e-shard 1/2  # Run half of the E2E suite
 """
 
-import subprocess
+import os
 import sys
+
+_SKIP_MESSAGE = "⏭️  Skipping local CI checks (CI_LOCAL_SKIP=1)"
+
+# Honour the pre-push opt-out before paying for the remaining imports
+if __name__ == "__main__" and os.environ.get("CI_LOCAL_SKIP") == "1":
+    print(_SKIP_MESSAGE)
+    sys.exit(0)
+
+import asyncio
+import hashlib
+import io
+import shlex
+import shutil
+import signal
+import subprocess
 import argparse
+import re
+import threading
 import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextvars import ContextVar
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Callable, Deque, Dict, Optional, List, Set, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
 ROOT = Path(__file__).parent.parent
+# Captured command output keeps only this many trailing lines
+_CAPTURE_MAX_LINES = 2000
+# Local stamps and tool caches that let repeat runs skip unchanged work
+CACHE_DIR = ROOT / ".ci-cache"
+
+# Network failure tokens seen in `bun audit` output; a match makes the audit retryable.
+_TRANSIENT_RE = re.compile(
+    "|".join(
+        map(
+            re.escape,
+            [
+                "connectionrefused",
+                "request failed",
+                "timed out",
+                "timeout",
+                "econnrefused",
+                "etimedout",
+                "enotfound",
+                "network",
+                "socket hang up",
+                "fetch failed",
+            ],
+        )
+    ),
+    re.IGNORECASE,
+)
+# Error-shaped lines carrying one of those tokens ("error: ConnectionRefused",
+# "ETIMEDOUT ..."): safe to abort a running audit on. Advisory titles or
+# package names that merely mention "timeout" or "network" do not match.
+_TRANSIENT_ERROR_LINE_RE = re.compile(
+    rf"^(?=.*(?:{_TRANSIENT_RE.pattern}))\s*(?:error:|(?-i:E[A-Z]{{3,}}\b))",
+    re.IGNORECASE,
+)
+# Inputs (git pathspecs) whose contents decide whether a cached pass still holds
+_DEPENDENCY_INPUTS = ["package.json", "bun.lock", "bun.lockb"]
+# "*.json" covers the tsconfig files and the JSON that typed code imports
+# (resolveJsonModule), e.g. lib/data/fault-glossary.json
+_TYPESCRIPT_INPUTS = ["*.ts", "*.tsx", "*.json", *_DEPENDENCY_INPUTS]
+_ESLINT_INPUTS = [*_TYPESCRIPT_INPUTS, "*.js", "*.jsx", "*.mjs"]
+_UNIT_TEST_INPUTS = [*_ESLINT_INPUTS, "*.snap"]
+_EAS_CONFIG_INPUTS = ["eas.json", "app.config.ts", "app.json", "package.json"]
+
+_DEPCHECK_NO_INSTALL_RE = re.compile(r"no-install", re.IGNORECASE)
+_DEPCHECK_MISSING_RE = re.compile(r"not installed|not found", re.IGNORECASE)
 
 
 class Colors:
@@ -34,6 +101,13 @@ class Colors:
     BOLD = "\033[1m"
 
 
+# No escape codes when output is piped (CI log capture, files). This has to
+# happen before anything below binds a color as a default or table value.
+if not sys.stdout.isatty():
+    for _name in [name for name in vars(Colors) if name.isupper()]:
+        setattr(Colors, _name, "")
+
+
 class Status(Enum):
     PASS = "pass"
     FAIL = "fail"
@@ -48,6 +122,174 @@ class StepResult:
     message: Optional[str] = None
 
 
+_STATUS_FMT = {
+    Status.PASS: (Colors.GREEN, "✅"),
+    Status.FAIL: (Colors.RED, "❌"),
+    Status.WARN: (Colors.YELLOW, "⚠️ "),
+    Status.SKIP: (Colors.CYAN, "⏭️ "),
+}
+
+
+def _format_result(result: StepResult) -> str:
+    color, icon = _STATUS_FMT[result.status]
+    msg = f" ({result.message})" if result.message else ""
+    return f"  {color}{icon} {result.name}{msg}{Colors.NC}"
+
+
+class ResultBus:
+    """Collects step results and prints each one as soon as it is published.
+
+    Gives a running scoreboard while later jobs (e.g. a long iOS build) are
+    still going, so print_summary only has to add the totals.
+    """
+
+    def __init__(self):
+        self.results: List[StepResult] = []
+        self._lock = threading.Lock()
+
+    def publish(self, results: List[StepResult]):
+        with self._lock:
+            self.results.extend(results)
+            for result in results:
+                print(_format_result(result))
+
+    def failed(self) -> bool:
+        return any(r.status == Status.FAIL for r in self.results)
+
+
+# Set while a job runs in parallel with others; its output is collected here
+# instead of being written straight to the terminal.
+_job_output: ContextVar[Optional[io.StringIO]] = ContextVar("_job_output", default=None)
+
+
+class _JobOutputRouter(io.TextIOBase):
+    """sys.stdout stand-in that routes writes from a buffered job to its buffer."""
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, text: str) -> int:
+        buffer = _job_output.get()
+        return (buffer if buffer is not None else self._stream).write(text)
+
+    def flush(self):
+        self._stream.flush()
+
+    def isatty(self) -> bool:
+        return self._stream.isatty()
+
+
+_router_lock = threading.Lock()
+
+
+def _route_job_output():
+    """Install the output router on sys.stdout (once per process)."""
+    with _router_lock:
+        if not isinstance(sys.stdout, _JobOutputRouter):
+            sys.stdout = _JobOutputRouter(sys.stdout)
+
+
+def run_buffered(
+    job: Callable[[], List[StepResult]],
+) -> Tuple[List[StepResult], str]:
+    """Run a job with its output collected, returning (results, output).
+
+    Module-level so it can also be shipped to a process pool worker.
+    """
+    _route_job_output()
+    buffer = io.StringIO()
+    token = _job_output.set(buffer)
+    try:
+        return job(), buffer.getvalue()
+    finally:
+        _job_output.reset(token)
+
+
+# Commands started by run(), tracked so --fail-fast can stop them mid-flight
+_active_procs: Set[subprocess.Popen] = set()
+_procs_lock = threading.Lock()
+_cancel_requested = threading.Event()
+
+
+def _spawn(cmd: List[str], **kwargs) -> subprocess.Popen:
+    with _procs_lock:
+        if _cancel_requested.is_set():
+            raise RuntimeError("Cancelled")
+        # Each command leads its own process group so a timeout or cancel also
+        # reaches the processes it starts (bunx -> depcheck, jest workers, ...)
+        proc = subprocess.Popen(cmd, start_new_session=True, **kwargs)
+        _active_procs.add(proc)
+    return proc
+
+
+def _kill_group(proc: subprocess.Popen, sig: int = signal.SIGKILL):
+    """Send ``sig`` to the process group ``proc`` leads (see _spawn)."""
+    try:
+        os.killpg(proc.pid, sig)
+    except ProcessLookupError:
+        pass  # Everything in the group has already exited
+
+
+def _forget(proc: subprocess.Popen):
+    with _procs_lock:
+        _active_procs.discard(proc)
+
+
+def cancel_running_commands():
+    """Terminate every in-flight run() command and refuse to start new ones."""
+    with _procs_lock:
+        _cancel_requested.set()
+        for proc in _active_procs:
+            _kill_group(proc, signal.SIGTERM)
+
+
+async def run_concurrently(
+    jobs: List[Callable[[], List[StepResult]]],
+    executor: Optional[Executor] = None,
+    fail_fast: bool = False,
+    on_done: Optional[Callable[[List[StepResult]], None]] = None,
+) -> List[Optional[List[StepResult]]]:
+    """Run jobs side by side, returning their results in the order given.
+
+    Each job runs on ``executor`` (the default thread pool if None) with its
+    own output buffer, which is printed as one block as soon as that job
+    finishes; its results are then passed to ``on_done``. With ``fail_fast``
+    the first job reporting a failure cancels the rest (thread executor
+    only): their commands are killed and they come back as None.
+    """
+    _route_job_output()
+    _cancel_requested.clear()
+    loop = asyncio.get_running_loop()
+
+    async def run_one(job: Callable[[], List[StepResult]]) -> Optional[List[StepResult]]:
+        results, output = await loop.run_in_executor(executor, run_buffered, job)
+        if _cancel_requested.is_set():
+            return None  # Cut short by fail-fast; its output is just the kill
+        print(output, end="")
+        if on_done is not None:
+            on_done(results)
+        return results
+
+    tasks = [asyncio.ensure_future(run_one(job)) for job in jobs]
+    pending = set(tasks) if fail_fast else set()
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            if any(r.status == Status.FAIL for task in done for r in task.result() or []):
+                cancel_running_commands()
+                break
+
+        # Wait for cancelled jobs too: their threads must be done before new
+        # commands are allowed again
+        await asyncio.gather(*tasks, return_exceptions=True)
+    finally:
+        # Cancellation only applies to this fan-out; later commands must run
+        _cancel_requested.clear()
+    return [task.result() for task in tasks]
+
+
 def log(msg: str, color: str = Colors.BLUE):
     print(f"{color}▶ {msg}{Colors.NC}")
 
@@ -75,39 +317,257 @@ def skip(msg: str):
 
 
 def run(
-    cmd: str,
+    cmd: List[str],
     cwd: Optional[Path] = None,
     check: bool = True,
     capture: bool = False,
     timeout: int = 600,
+    env: Optional[Dict[str, str]] = None,
+    stop_on: Optional["re.Pattern[str]"] = None,
 ) -> Tuple[bool, str]:
-    """Run command and return (success, output)."""
-    print(f"\n{Colors.CYAN}$ {cmd}{Colors.NC}")
+    """Run command and return (success, output).
+
+    Commands are argv lists executed without a shell. With ``capture`` the
+    combined stdout+stderr is returned instead of printed; it is read line by
+    line and only the last ``_CAPTURE_MAX_LINES`` lines are kept. The first
+    captured line matching ``stop_on`` terminates the command early (reported
+    as a failure). ``env`` entries are layered over the current environment.
+    """
+    print(f"\n{Colors.CYAN}$ {shlex.join(cmd)}{Colors.NC}")
+    # Child processes write to the real stdout, so buffered jobs capture them.
+    buffer = _job_output.get()
+    pipe = capture or buffer is not None
     try:
-        result = subprocess.run(
+        proc = _spawn(
             cmd,
-            shell=True,
             cwd=cwd or ROOT,
-            capture_output=capture,
+            stdout=subprocess.PIPE if pipe else None,
+            stderr=subprocess.STDOUT if pipe else None,
             text=True,
-            timeout=timeout,
+            errors="replace",  # Never let undecodable output abort a job
+            env={**os.environ, **env} if env else None,
         )
-        output = result.stdout if capture else ""
-        if result.returncode != 0:
-            if capture and result.stderr:
-                output = result.stderr
-            return (False, output)
-        return (True, output)
-    except subprocess.TimeoutExpired:
+    except Exception as e:
+        error(str(e))  # e.g. the tool is not installed
+        return (False, str(e))
+
+    timed_out = threading.Event()
+
+    def kill_on_timeout():
+        timed_out.set()
+        _kill_group(proc)
+
+    timer = threading.Timer(timeout, kill_on_timeout)
+    timer.start()
+    tail: Deque[str] = deque(maxlen=_CAPTURE_MAX_LINES)
+    stopped = False
+    try:
+        if proc.stdout is not None:
+            for line in proc.stdout:
+                if not capture:
+                    buffer.write(line)
+                    continue
+                tail.append(line)
+                if stop_on is not None and stop_on.search(line):
+                    stopped = True
+                    _kill_group(proc, signal.SIGTERM)
+                    break
+        proc.wait()
+    except BaseException:
+        # Ctrl-C no longer reaches the child's own process group
+        _kill_group(proc)
+        raise
+    finally:
+        timer.cancel()
+        _forget(proc)
+        if proc.stdout is not None:
+            proc.stdout.close()
+
+    if timed_out.is_set():
         return (False, "Command timed out")
+    return (proc.returncode == 0 and not stopped, "".join(tail))
+
+
+def run_search(
+    cmd: List[str], cwd: Optional[Path] = None, timeout: int = 120
+) -> Tuple[Optional[int], List[str], str]:
+    """Run a grep-style command and return (exit status, stdout lines, stderr).
+
+    grep, rg and git grep exit 0 with matches, 1 without and higher on
+    errors, so stderr is kept apart instead of being read as matches. The
+    status is None if the command could not start or timed out.
+    """
+    print(f"\n{Colors.CYAN}$ {shlex.join(cmd)}{Colors.NC}")
+    try:
+        proc = _spawn(
+            cmd,
+            cwd=cwd or ROOT,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            errors="replace",
+        )
     except Exception as e:
+        return (None, [], str(e))
+    try:
+        stdout, stderr = proc.communicate(timeout=timeout)
+    except BaseException as e:
+        _kill_group(proc)
+        proc.wait()
+        if not isinstance(e, subprocess.TimeoutExpired):
+            raise
+        return (None, [], "Command timed out")
+    finally:
+        _forget(proc)
+    return (proc.returncode, stdout.splitlines(), stderr.strip())
+
+
+def run_piped(
+    cmd: List[str],
+    filter_cmd: List[str],
+    cwd: Optional[Path] = None,
+    timeout: int = 600,
+    env: Optional[Dict[str, str]] = None,
+) -> Tuple[bool, str]:
+    """Run ``cmd | filter_cmd`` without a shell and return (success, output).
+
+    Success follows ``cmd``: unlike a plain shell pipeline, a failing command
+    is not masked by the filter's exit status. ``env`` entries are layered
+    over the current environment for ``cmd``.
+    """
+    print(f"\n{Colors.CYAN}$ {shlex.join(cmd)} | {shlex.join(filter_cmd)}{Colors.NC}")
+    buffer = _job_output.get()
+    try:
+        producer = _spawn(
+            cmd,
+            cwd=cwd or ROOT,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            env={**os.environ, **env} if env else None,
+        )
+    except Exception as e:
+        error(str(e))
+        return (False, str(e))
+    try:
+        consumer = subprocess.Popen(
+            filter_cmd,
+            cwd=cwd or ROOT,
+            stdin=producer.stdout,
+            stdout=subprocess.PIPE if buffer is not None else None,
+            stderr=subprocess.STDOUT if buffer is not None else None,
+            text=True,
+            errors="replace",
+        )
+    except Exception as e:
+        _kill_group(producer)
+        producer.wait()
+        _forget(producer)
+        error(str(e))
         return (False, str(e))
+    # Only the filter reads the pipe now; closing our copy lets the producer
+    # see SIGPIPE if the filter exits early.
+    assert producer.stdout is not None
+    producer.stdout.close()
+
+    deadline = time.monotonic() + timeout
+    try:
+        output, _ = consumer.communicate(timeout=timeout)
+        returncode = producer.wait(timeout=max(deadline - time.monotonic(), 0))
+    except BaseException as e:
+        # Timeout or Ctrl-C: take down the producer's whole group, which also
+        # closes the pipe the filter is reading from
+        _kill_group(producer)
+        consumer.kill()
+        for proc in (producer, consumer):
+            proc.wait()
+        if not isinstance(e, subprocess.TimeoutExpired):
+            raise
+        return (False, "Command timed out")
+    finally:
+        _forget(producer)
+
+    if buffer is not None and output:
+        buffer.write(output)
+    return (returncode == 0, "")
+
+
+def digest_files(paths: List[Path]) -> str:
+    """blake2b digest over the names and contents of ``paths`` (missing files hash as empty)."""
+    digest = hashlib.blake2b()
+    for path in paths:
+        digest.update(str(path.relative_to(ROOT)).encode() + b"\0")
+        if path.exists():
+            digest.update(path.read_bytes())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
 
+def cache_hit(key: str, digest: str) -> bool:
+    """Whether ``digest`` matches the stamp last stored under ``key``."""
+    stamp = CACHE_DIR / key
+    return stamp.is_file() and stamp.read_text() == digest
 
-def check_tool(name: str, cmd: str) -> bool:
-    """Check if a tool is available."""
-    result = subprocess.run(f"command -v {cmd}", shell=True, capture_output=True)
-    return result.returncode == 0
+
+def cache_store(key: str, digest: str):
+    """Record ``digest`` under ``key``, atomically replacing any older stamp."""
+    CACHE_DIR.mkdir(exist_ok=True)
+    tmp = CACHE_DIR / f"{key}.tmp"
+    tmp.write_text(digest)
+    tmp.replace(CACHE_DIR / key)
+
+
+def sources_digest(pathspecs: List[str]) -> Optional[str]:
+    """Digest of the tracked and untracked (non-ignored) files matching ``pathspecs``.
+
+    Returns None when the file list can't be taken from git, in which case
+    nothing should be cached.
+    """
+    try:
+        result = subprocess.run(
+            [
+                "git",
+                "ls-files",
+                "-z",
+                "--cached",
+                "--others",
+                "--exclude-standard",
+                "--",
+                *pathspecs,
+                ":(exclude,glob)**/node_modules/**",
+            ],
+            cwd=ROOT,
+            capture_output=True,
+        )
+    except OSError:
+        return None
+    if result.returncode != 0:
+        return None
+    paths = sorted({ROOT / name.decode() for name in result.stdout.split(b"\0") if name})
+    return digest_files(paths)
+
+
+def run_if_changed(
+    key: str,
+    name: str,
+    pathspecs: List[str],
+    check: Callable[[], List[StepResult]],
+) -> List[StepResult]:
+    """Run ``check`` unless its inputs are unchanged since it last fully passed."""
+    digest = sources_digest(pathspecs)
+    if digest is not None and cache_hit(key, digest):
+        skip(f"{name} skipped: unchanged since last pass")
+        return [StepResult(name, Status.SKIP, "unchanged since last pass")]
+
+    results = check()
+    if digest is not None and all(r.status == Status.PASS for r in results):
+        cache_store(key, digest)
+    return results
+
+
+@lru_cache(maxsize=None)
+def check_tool(cmd: str) -> bool:
+    """Check if a tool is available on PATH (memoized per command)."""
+    return shutil.which(cmd) is not None
 
 
 def run_job_conflict_markers() -> List[StepResult]:
@@ -117,12 +577,9 @@ def run_job_conflict_markers() -> List[StepResult]:
 
     log("Scanning for merge conflict markers...")
 
-    # Patterns that indicate unresolved merge conflicts
-    conflict_patterns = [
-        r"<<<<<<<",
-        r">>>>>>>",
-        r"^=======$",  # Exact match for separator line
-    ]
+    # Patterns that indicate unresolved merge conflicts (the separator must be
+    # an exact line match), joined into one alternation
+    conflict_pattern = r"<<<<<<<|>>>>>>>|^=======$"
 
     # File extensions to check (skip binary, node_modules, etc.)
     extensions = [
@@ -141,27 +598,60 @@ def run_job_conflict_markers() -> List[StepResult]:
         "*.h",
         "*.sql",
     ]
-
-    # Build grep command
-    include_flags = " ".join([f'--include="{ext}"' for ext in extensions])
-    exclude_flags = "--exclude-dir=node_modules --exclude-dir=.git --exclude-dir=ios --exclude-dir=android --exclude-dir=.expo"
-
-    found_conflicts = []
-
-    for pattern in conflict_patterns:
-        cmd = f'grep -rn "{pattern}" {include_flags} {exclude_flags} . 2>/dev/null || true'
-        ok, output = run(cmd, capture=True)
-        if output.strip():
-            found_conflicts.append(output.strip())
-
-    if found_conflicts:
+    exclude_dirs = ["node_modules", ".git", "ios", "android", ".expo"]
+
+    # Single pass over the tree: one process and one directory walk for all patterns.
+    # git grep reads the index instead of stat-ing every file, so prefer it in a
+    # checkout; --untracked still covers new files that are not yet staged.
+    # The scan only lists matching files (-l); line numbers are fetched from
+    # those files afterwards, so the common no-conflict case stays cheap.
+    if (ROOT / ".git").exists():
+        pathspecs = extensions + [
+            f":(exclude,glob)**/{d}/**" for d in exclude_dirs if d != ".git"
+        ]
+        # Unquoted paths: the listed names are fed back as pathspecs, and a
+        # quoted "caf\303\251.ts" would match nothing
+        git_grep = ["git", "-c", "core.quotePath=false", "grep", "--untracked"]
+        list_cmd = [*git_grep, "-lE", conflict_pattern, "--", *pathspecs]
+        detail_cmd = [*git_grep, "-nE", conflict_pattern, "--"]
+    elif check_tool("rg"):
+        glob_flags = [
+            flag
+            for glob in [f"!{d}" for d in exclude_dirs] + extensions
+            for flag in ("-g", glob)
+        ]
+        # --hidden: rg skips dot-directories by default, which would leave out
+        # .github/workflows; .git stays excluded by its glob
+        list_cmd = [
+            "rg", "--hidden", "--no-messages", "-l", "-e", conflict_pattern, *glob_flags, "."
+        ]
+        detail_cmd = ["rg", "--hidden", "--no-messages", "-nH", "-e", conflict_pattern]
+    else:
+        include_flags = [f"--include={ext}" for ext in extensions]
+        exclude_flags = [f"--exclude-dir={d}" for d in exclude_dirs]
+        list_cmd = ["grep", "-rlsE", conflict_pattern, *include_flags, *exclude_flags, "."]
+        detail_cmd = ["grep", "-nHsE", conflict_pattern]
+
+    status, conflicted_files, scan_error = run_search(list_cmd)
+    found_conflicts: List[str] = []
+    if conflicted_files:
+        status, found_conflicts, scan_error = run_search(detail_cmd + conflicted_files)
+        # The listing already found markers; never let the second pass turn
+        # that into a PASS
+        if not found_conflicts:
+            found_conflicts = conflicted_files
+
+    # Matches win over a partial error (e.g. rg exits 2 on an unreadable file)
+    if not found_conflicts and status not in (0, 1):
+        reason = scan_error.splitlines()[0] if scan_error else f"exit status {status}"
+        warn(f"Could not scan for merge conflict markers: {reason}")
+        results.append(StepResult("Conflict markers", Status.WARN, "Scan failed"))
+    elif found_conflicts:
         error("MERGE CONFLICT MARKERS FOUND!")
         error("The following files contain unresolved merge conflicts:")
         print()
-        for conflict in found_conflicts:
-            for line in conflict.split("\n"):
-                if line.strip():
-                    print(f"  {Colors.RED}{line}{Colors.NC}")
+        for line in found_conflicts:
+            print(f"  {Colors.RED}{line}{Colors.NC}")
         print()
         error("Fix these conflicts before committing/pushing!")
         results.append(
@@ -174,82 +664,143 @@ def run_job_conflict_markers() -> List[StepResult]:
     return results
 
 
-def run_job_quality() -> List[StepResult]:
+def run_job_quality(fail_fast: bool = False) -> List[StepResult]:
     """Job 1: Code Quality & Testing (mirrors 'quality' job in CI)"""
     log_job(1, "Code Quality & Testing")
     results = []
 
     # Install dependencies
-    log("Installing dependencies...")
-    ok, _ = run("bun install")
-    results.append(StepResult("Install deps", Status.PASS if ok else Status.FAIL))
-    if not ok:
+    results.append(_bun_install_if_stale())
+    if results[-1].status == Status.FAIL:
         error("Dependency install failed - cannot continue")
         return results
+
+    # The remaining checks only depend on the install, so they run side by side
+    checks = {
+        "CI policy": _check_ci_policy,
+        "TypeScript": partial(
+            run_if_changed, "typescript", "TypeScript", _TYPESCRIPT_INPUTS, _check_typescript
+        ),
+        "ESLint": partial(run_if_changed, "eslint", "ESLint", _ESLINT_INPUTS, _check_eslint),
+        "Depcheck": _check_depcheck,
+    }
+    outcomes = asyncio.run(run_concurrently(list(checks.values()), fail_fast=fail_fast))
+    for name, check_results in zip(checks, outcomes):
+        if check_results is None:
+            skip(f"{name} cancelled (--fail-fast)")
+            results.append(StepResult(name, Status.SKIP, "Cancelled by --fail-fast"))
+        else:
+            results.extend(check_results)
+
+    return results
+
+
+def _bun_install_if_stale() -> StepResult:
+    """Run `bun install` unless package.json and the lockfile are unchanged since the last one."""
+    install_inputs = [ROOT / "package.json", ROOT / "bun.lock", ROOT / "bun.lockb"]
+    if (ROOT / "node_modules").is_dir() and cache_hit(
+        "bun-install", digest_files(install_inputs)
+    ):
+        skip("Dependencies unchanged since last install")
+        return StepResult("Install deps", Status.SKIP, "cache hit")
+
+    log("Installing dependencies...")
+    ok, _ = run(["bun", "install"])
+    if not ok:
+        return StepResult("Install deps", Status.FAIL)
+    # Hash after installing: bun may have rewritten the lockfile
+    cache_store("bun-install", digest_files(install_inputs))
     success("Dependencies installed")
+    return StepResult("Install deps", Status.PASS)
+
 
+def _check_ci_policy() -> List[StepResult]:
     log("Running workflow policy checks...")
-    ok, _ = run("bun run ci:policy")
-    results.append(StepResult("CI policy", Status.PASS if ok else Status.FAIL))
+    ok, _ = run(["bun", "run", "ci:policy"])
     if ok:
         success("Workflow policy checks passed")
     else:
         error("Workflow policy violations found")
+    return [StepResult("CI policy", Status.PASS if ok else Status.FAIL)]
 
-    # TypeScript type checking
+
+def _check_typescript() -> List[StepResult]:
     log("TypeScript type checking...")
-    ok, _ = run("bun run tsc --noEmit")
-    results.append(StepResult("TypeScript", Status.PASS if ok else Status.FAIL))
+    # Incremental build info lets tsc re-check only files affected by changes
+    CACHE_DIR.mkdir(exist_ok=True)
+    ok, _ = run(
+        [
+            "bun",
+            "run",
+            "tsc",
+            "--noEmit",
+            "--incremental",
+            "--tsBuildInfoFile",
+            str(CACHE_DIR / "tsc.tsbuildinfo"),
+        ]
+    )
     if ok:
         success("TypeScript check passed")
     else:
         error("TypeScript errors found")
+    return [StepResult("TypeScript", Status.PASS if ok else Status.FAIL)]
+
 
-    # ESLint
+def _check_eslint() -> List[StepResult]:
     log("Running ESLint...")
-    ok, _ = run("bun run lint")
-    results.append(StepResult("ESLint", Status.PASS if ok else Status.FAIL))
+    # Content-hashed cache: only re-lint changed files, and survive checkouts
+    # that touch mtimes without changing contents
+    CACHE_DIR.mkdir(exist_ok=True)
+    ok, _ = run(
+        [
+            "bun",
+            "run",
+            "lint",
+            "--cache",
+            "--cache-location",
+            str(CACHE_DIR / "eslintcache"),
+            "--cache-strategy",
+            "content",
+        ]
+    )
     if ok:
         success("ESLint passed")
     else:
         error("ESLint errors found")
+    return [StepResult("ESLint", Status.PASS if ok else Status.FAIL)]
+
 
-    # Unused dependencies check (non-blocking)
+def _check_depcheck() -> List[StepResult]:
+    """Unused dependencies check (non-blocking)."""
     log("Checking for unused dependencies...")
-    depcheck_cmd = (
-        "bunx --no-install depcheck "
-        "--ignores='@types/*,eslint*,@babel/*,babel-*,metro-*,expo-*,playwright,jest-expo,@testing-library/*'"
-    )
-    ok, output = run(depcheck_cmd, capture=True, timeout=120)
+    depcheck_cmd = [
+        "bunx",
+        "--no-install",
+        "depcheck",
+        "--ignores=@types/*,eslint*,@babel/*,babel-*,metro-*,expo-*,playwright,jest-expo,@testing-library/*",
+    ]
+    ok, output = run(depcheck_cmd, capture=True, timeout=90)
     if output.strip():
         print(output.rstrip())
 
     if ok:
-        results.append(StepResult("Depcheck", Status.PASS, "Non-blocking"))
         success("Dependency check complete")
-        return results
+        return [StepResult("Depcheck", Status.PASS, "Non-blocking")]
 
     # Depcheck is non-blocking and should never hang `git push` due to a missing install or slow network.
     if output.strip() == "Command timed out":
-        results.append(StepResult("Depcheck", Status.WARN, "Timed out (non-blocking)"))
         warn("depcheck timed out (non-blocking)")
-        return results
+        return [StepResult("Depcheck", Status.WARN, "Timed out (non-blocking)")]
 
-    depcheck_output_lower = output.lower()
-    if "no-install" in depcheck_output_lower and (
-        "not installed" in depcheck_output_lower or "not found" in depcheck_output_lower
-    ):
-        results.append(
-            StepResult("Depcheck", Status.SKIP, "depcheck not installed (non-blocking)")
-        )
+    if _DEPCHECK_NO_INSTALL_RE.search(output) and _DEPCHECK_MISSING_RE.search(output):
         warn("depcheck not installed (non-blocking)")
         warn("Install with: bun add -d depcheck")
-        return results
+        return [
+            StepResult("Depcheck", Status.SKIP, "depcheck not installed (non-blocking)")
+        ]
 
-    results.append(StepResult("Depcheck", Status.WARN, "Non-blocking"))
     warn("depcheck reported issues (non-blocking)")
-
-    return results
+    return [StepResult("Depcheck", Status.WARN, "Non-blocking")]
 
 
 def run_job_build_check() -> List[StepResult]:
@@ -257,9 +808,15 @@ def run_job_build_check() -> List[StepResult]:
     log_job(2, "Build Verification")
     results = []
 
+    eas_inputs = [ROOT / name for name in _EAS_CONFIG_INPUTS]
+    if cache_hit("eas-config", digest_files(eas_inputs)):
+        skip("EAS config unchanged since it last validated")
+        results.append(StepResult("EAS config", Status.SKIP, "cache hit"))
+        return results
+
     # Check if EAS CLI is available and logged in
     log("Verifying EAS configuration...")
-    ok, output = run("bunx eas whoami", capture=True)
+    ok, output = run(["bunx", "eas", "whoami"], capture=True)
     if not ok:
         warn("Not logged into EAS - skipping EAS verification")
         warn("Run 'bunx eas login' to enable this check")
@@ -271,10 +828,13 @@ def run_job_build_check() -> List[StepResult]:
     # Verify EAS config by checking eas.json validity
     log("Verifying EAS build config...")
     ok, _ = run(
-        "bunx eas config --platform ios --profile preview", capture=True, timeout=60
+        ["bunx", "eas", "config", "--platform", "ios", "--profile", "preview"],
+        capture=True,
+        timeout=60,
     )
     results.append(StepResult("EAS config", Status.PASS if ok else Status.WARN))
     if ok:
+        cache_store("eas-config", digest_files(eas_inputs))
         success("EAS configuration valid")
     else:
         warn("EAS config check had issues (may still work in CI)")
@@ -286,27 +846,31 @@ def run_job_deploy_preflight() -> List[StepResult]:
     log_job(25, "Deploy Preflight")
     results = []
 
-    env_prefix = (
-        "EXPO_TOKEN=dummy "
-        "SUPABASE_ACCESS_TOKEN=dummy "
-        "SUPABASE_STAGING_PROJECT_REF=dummy "
-        "SUPABASE_PRODUCTION_PROJECT_REF=dummy "
-        "ASC_API_KEY_P8_BASE64=dummy "
-    )
+    dummy_env = {
+        name: "dummy"
+        for name in (
+            "EXPO_TOKEN",
+            "SUPABASE_ACCESS_TOKEN",
+            "SUPABASE_STAGING_PROJECT_REF",
+            "SUPABASE_PRODUCTION_PROJECT_REF",
+            "ASC_API_KEY_P8_BASE64",
+        )
+    }
+    preflight_cmd = [sys.executable, "scripts/ci/deploy_preflight.py"]
 
     log("Running staging preflight (expected pass)...")
     ok, _ = run(
-        env_prefix
-        + "python3 scripts/ci/deploy_preflight.py --env staging --ref refs/heads/develop",
+        preflight_cmd + ["--env", "staging", "--ref", "refs/heads/develop"],
         capture=True,
+        env=dummy_env,
     )
     results.append(StepResult("Preflight staging", Status.PASS if ok else Status.FAIL))
 
     log("Running production preflight (expected pass)...")
     ok, _ = run(
-        env_prefix
-        + "python3 scripts/ci/deploy_preflight.py --env production --ref refs/heads/main",
+        preflight_cmd + ["--env", "production", "--ref", "refs/heads/main"],
         capture=True,
+        env=dummy_env,
     )
     results.append(
         StepResult("Preflight production", Status.PASS if ok else Status.FAIL)
@@ -314,10 +878,10 @@ def run_job_deploy_preflight() -> List[StepResult]:
 
     log("Running production preflight on wrong ref (expected fail)...")
     ok, _ = run(
-        env_prefix
-        + "python3 scripts/ci/deploy_preflight.py --env production --ref refs/heads/feature",
+        preflight_cmd + ["--env", "production", "--ref", "refs/heads/feature"],
         capture=True,
         check=False,
+        env=dummy_env,
     )
     results.append(
         StepResult("Preflight wrong-ref fail", Status.PASS if not ok else Status.FAIL)
@@ -326,6 +890,33 @@ def run_job_deploy_preflight() -> List[StepResult]:
     return results
 
 
+def _ccache_build_settings() -> Tuple[List[str], Optional[Dict[str, str]]]:
+    """xcodebuild settings and env routing clang through ccache, if installed.
+
+    Uses the compiler symlinks in ccache's libexec/ (Homebrew layout): Xcode
+    needs CC/CXX to be a single executable, not a "ccache clang" command line.
+    """
+    ccache = shutil.which("ccache")
+    if ccache is None:
+        return ([], None)
+    libexec = Path(ccache).resolve().parent.parent / "libexec"
+    if not (libexec / "clang").exists():
+        return ([], None)
+    settings = [
+        f"CC={libexec / 'clang'}",
+        f"CXX={libexec / 'clang++'}",
+        f"LD={libexec / 'clang'}",
+        f"LDPLUSPLUS={libexec / 'clang++'}",
+    ]
+    env = {
+        "CCACHE_DIR": str(CACHE_DIR / "ccache"),
+        # Xcode passes per-build index store paths and __DATE__/__TIME__ are
+        # rarely meaningful here; without these most lookups would miss.
+        "CCACHE_SLOPPINESS": "clang_index_store,time_macros",
+    }
+    return (settings, env)
+
+
 def run_job_prebuild() -> List[StepResult]:
     """Job 3: Expo Prebuild & Native Build"""
     log_job(3, "Expo Prebuild & Native Build")
@@ -333,7 +924,8 @@ def run_job_prebuild() -> List[StepResult]:
 
     # Expo prebuild
     log("Running expo prebuild (generates ios/android)...")
-    ok, _ = run("bunx expo prebuild --clean", timeout=300)
+    # JS dependencies are installed by the quality job and pods just below
+    ok, _ = run(["bunx", "expo", "prebuild", "--clean", "--no-install"], timeout=180)
     results.append(StepResult("Expo prebuild", Status.PASS if ok else Status.FAIL))
     if ok:
         success("Prebuild complete")
@@ -345,7 +937,7 @@ def run_job_prebuild() -> List[StepResult]:
     ios_dir = ROOT / "ios"
     if ios_dir.exists():
         log("Running pod install...")
-        ok, _ = run("pod install", cwd=ios_dir, timeout=300)
+        ok, _ = run(["pod", "install"], cwd=ios_dir, timeout=300)
         results.append(StepResult("Pod install", Status.PASS if ok else Status.FAIL))
         if ok:
             success("Pod install complete")
@@ -356,18 +948,33 @@ def run_job_prebuild() -> List[StepResult]:
         # iOS build check (simulator, no signing)
         log("Building iOS for simulator (no signing)...")
 
-        # Check for xcpretty
-        has_xcpretty = check_tool("xcpretty", "xcpretty")
-        pipe_cmd = "| xcpretty" if has_xcpretty else ""
-
-        xcode_cmd = (
-            f"xcodebuild -workspace formfactoreas.xcworkspace "
-            f"-scheme formfactoreas -configuration Debug "
-            f"-sdk iphonesimulator "
-            f"-destination 'platform=iOS Simulator,name=iPhone 15 Pro' "
-            f"build CODE_SIGNING_ALLOWED=NO {pipe_cmd}"
-        )
-        ok, _ = run(xcode_cmd, cwd=ios_dir, timeout=600)
+        xcode_cmd = [
+            "xcodebuild",
+            "-workspace",
+            "formfactoreas.xcworkspace",
+            "-scheme",
+            "formfactoreas",
+            "-configuration",
+            "Debug",
+            "-sdk",
+            "iphonesimulator",
+            "-destination",
+            "platform=iOS Simulator,name=iPhone 15 Pro",
+            "-parallelizeTargets",
+            "-jobs",
+            str(os.cpu_count() or 1),
+            "build",
+            "CODE_SIGNING_ALLOWED=NO",
+        ]
+        ccache_settings, ccache_env = _ccache_build_settings()
+        xcode_cmd += ccache_settings
+        # Pipe through xcpretty when available
+        if check_tool("xcpretty"):
+            ok, _ = run_piped(
+                xcode_cmd, ["xcpretty"], cwd=ios_dir, timeout=600, env=ccache_env
+            )
+        else:
+            ok, _ = run(xcode_cmd, cwd=ios_dir, timeout=600, env=ccache_env)
         results.append(StepResult("iOS build", Status.PASS if ok else Status.FAIL))
         if ok:
             success("iOS build succeeded")
@@ -383,17 +990,17 @@ def run_job_prebuild() -> List[StepResult]:
 def run_job_tests() -> List[StepResult]:
     """Job 4: Unit Tests"""
     log_job(4, "Unit Tests")
-    results = []
+    return run_if_changed("unit-tests", "Unit tests", _UNIT_TEST_INPUTS, _run_unit_tests)
+
 
+def _run_unit_tests() -> List[StepResult]:
     log("Running Jest unit tests...")
-    ok, _ = run("bun run test -- --passWithNoTests", timeout=120)
-    results.append(StepResult("Unit tests", Status.PASS if ok else Status.WARN))
+    ok, _ = run(["bun", "run", "test", "--", "--passWithNoTests"], timeout=120)
     if ok:
         success("Unit tests passed")
     else:
         warn("Some unit tests failed")
-
-    return results
+    return [StepResult("Unit tests", Status.PASS if ok else Status.WARN)]
 
 
 def run_job_security() -> List[StepResult]:
@@ -403,37 +1010,26 @@ def run_job_security() -> List[StepResult]:
 
     # Dependency audit (mirrors CI)
     log("Running critical dependency audit...")
-    transient_markers = [
-        "connectionrefused",
-        "request failed",
-        "timed out",
-        "timeout",
-        "econnrefused",
-        "etimedout",
-        "enotfound",
-        "network",
-        "socket hang up",
-        "fetch failed",
-    ]
-
     max_attempts = 3
     final_ok = False
     final_output = ""
     last_error_was_transient = False
 
     for attempt in range(1, max_attempts + 1):
-        # Capture both stdout/stderr so network failure tokens are not lost.
-        ok, output = run("bun audit --audit-level critical 2>&1", capture=True)
+        # Stream stdout+stderr so a network error cuts the attempt short
+        # instead of waiting for the audit to give up on its own.
+        ok, output = run(
+            ["bun", "audit", "--audit-level", "critical"],
+            capture=True,
+            stop_on=_TRANSIENT_ERROR_LINE_RE,
+        )
         final_ok = ok
         final_output = output
 
         if ok:
             break
 
-        output_lower = output.lower()
-        last_error_was_transient = any(
-            token in output_lower for token in transient_markers
-        )
+        last_error_was_transient = bool(_TRANSIENT_RE.search(output))
 
         if not last_error_was_transient:
             break
@@ -461,7 +1057,7 @@ def run_job_security() -> List[StepResult]:
             print(final_output.rstrip())
 
     log("Running full dependency audit (non-blocking, tracked)...")
-    ok, output = run("bun audit --audit-level moderate 2>&1", capture=True)
+    ok, output = run(["bun", "audit", "--audit-level", "moderate"], capture=True)
     if ok:
         results.append(StepResult("Dep audit (moderate)", Status.PASS))
         success("No moderate-or-higher vulnerabilities found")
@@ -485,7 +1081,7 @@ def run_job_security() -> List[StepResult]:
     if audit_config.exists():
         if any(lockfile.exists() for lockfile in lockfiles):
             log("Running audit-ci...")
-            ok, _ = run(f"bunx audit-ci --config {audit_config}")
+            ok, _ = run(["bunx", "audit-ci", "--config", str(audit_config)])
             results.append(StepResult("audit-ci", Status.PASS if ok else Status.FAIL))
             if not ok:
                 error("audit-ci failed")
@@ -498,14 +1094,24 @@ def run_job_security() -> List[StepResult]:
     return results
 
 
-def run_job_e2e() -> List[StepResult]:
+def run_job_e2e(shard: Optional[str] = None) -> List[StepResult]:
     """Job 6: E2E Tests (Playwright)"""
     log_job(6, "E2E Tests (Playwright)")
     results = []
+    name = f"E2E tests (shard {shard})" if shard else "E2E tests"
+
+    cmd = ["bunx", "playwright", "test"]
+    # Playwright only uses half the cores locally by default; the suite is
+    # fullyParallel, so give it one worker per core. Under CI the config pins
+    # a single worker against the shared port-3001 web server, so leave it be.
+    if not os.environ.get("CI"):
+        cmd.append(f"--workers={os.cpu_count() or 1}")
+    if shard:
+        cmd.append(f"--shard={shard}")
 
     log("Running Playwright E2E tests...")
-    ok, _ = run("bunx playwright test", timeout=300)
-    results.append(StepResult("E2E tests", Status.PASS if ok else Status.FAIL))
+    ok, _ = run(cmd, timeout=300)
+    results.append(StepResult(name, Status.PASS if ok else Status.FAIL))
     if ok:
         success("E2E tests passed")
     else:
@@ -525,19 +1131,8 @@ def print_summary(all_results: List[StepResult]):
     warned = [r for r in all_results if r.status == Status.WARN]
     skipped = [r for r in all_results if r.status == Status.SKIP]
 
-    for r in all_results:
-        if r.status == Status.PASS:
-            print(f"  {Colors.GREEN}✅ {r.name}{Colors.NC}")
-        elif r.status == Status.FAIL:
-            print(f"  {Colors.RED}❌ {r.name}{Colors.NC}")
-        elif r.status == Status.WARN:
-            msg = f" ({r.message})" if r.message else ""
-            print(f"  {Colors.YELLOW}⚠️  {r.name}{msg}{Colors.NC}")
-        elif r.status == Status.SKIP:
-            msg = f" ({r.message})" if r.message else ""
-            print(f"  {Colors.CYAN}⏭️  {r.name}{msg}{Colors.NC}")
-
-    print(f"\n{Colors.BOLD}Results:{Colors.NC}")
+    # Individual results were already printed live by the ResultBus
+    print(f"{Colors.BOLD}Results:{Colors.NC}")
     print(f"  Passed:  {len(passed)}")
     print(f"  Failed:  {len(failed)}")
     print(f"  Warned:  {len(warned)}")
@@ -556,7 +1151,24 @@ def print_summary(all_results: List[StepResult]):
         return True
 
 
+def _shard_arg(value: str) -> str:
+    """argparse type for Playwright's ``--shard=I/N`` (1 <= I <= N)."""
+    match = re.fullmatch(r"(\d+)/(\d+)", value)
+    if not match or not 1 <= int(match.group(1)) <= int(match.group(2)):
+        raise argparse.ArgumentTypeError(f"expected I/N with 1 <= I <= N, got {value!r}")
+    return value
+
+
 def main():
+    if os.environ.get("CI_LOCAL_SKIP") == "1":
+        print(_SKIP_MESSAGE)
+        sys.exit(0)
+
+    if not sys.stdout.isatty():
+        # Flush per line: log viewers see progress live, and our headers stay
+        # ordered with the output of child processes sharing the same fd.
+        sys.stdout.reconfigure(line_buffering=True)
+
     parser = argparse.ArgumentParser(
         description="Run CI checks locally before pushing",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -565,17 +1177,36 @@ Examples:
     python3 scripts/ci_local.py           # Full check
     python3 scripts/ci_local.py --quick   # Skip native build
     python3 scripts/ci_local.py --e2e     # Include E2E tests
+    python3 scripts/ci_local.py --fail-fast  # Stop quality checks at first failure
+    python3 scripts/ci_local.py --e2e --e2e-shard 1/2  # Run half of the E2E suite
         """,
     )
     parser.add_argument(
         "--quick", action="store_true", help="Skip native build (faster)"
     )
     parser.add_argument("--e2e", action="store_true", help="Include E2E tests")
+    parser.add_argument(
+        "--e2e-shard",
+        type=_shard_arg,
+        metavar="I/N",
+        help="Only run shard I of N of the E2E suite (implies --e2e)",
+    )
     parser.add_argument(
         "--skip-prebuild", action="store_true", help="Skip expo prebuild step"
     )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Cancel the remaining quality checks as soon as one fails",
+    )
     args = parser.parse_args()
 
+    # Every bun/bunx step is a fresh bun process; share one on-disk transpiler
+    # cache between them (and between runs) unless the caller chose their own.
+    os.environ.setdefault(
+        "BUN_RUNTIME_TRANSPILER_CACHE_PATH", str(CACHE_DIR / "bun-transpiler")
+    )
+
     print(f"{Colors.BOLD}{Colors.MAGENTA}")
     print("╔══════════════════════════════════════════════════════════╗")
     print("║           Form Factor - Local CI Check                   ║")
@@ -583,53 +1214,57 @@ Examples:
     print("╚══════════════════════════════════════════════════════════╝")
     print(f"{Colors.NC}")
 
-    all_results: List[StepResult] = []
+    bus = ResultBus()
 
     # Job 0: Conflict marker check (MUST pass before anything else)
-    all_results.extend(run_job_conflict_markers())
-    if any(r.status == Status.FAIL for r in all_results):
+    bus.publish(run_job_conflict_markers())
+    if bus.failed():
         error("Merge conflict markers detected - fix before continuing!")
-        print_summary(all_results)
+        print_summary(bus.results)
         sys.exit(1)
 
     # Job 1: Quality
-    all_results.extend(run_job_quality())
+    bus.publish(run_job_quality(fail_fast=args.fail_fast))
 
     # Check for blocking failures
-    if any(r.status == Status.FAIL for r in all_results):
+    if bus.failed():
         error("Quality checks failed - fix before continuing")
-        print_summary(all_results)
+        print_summary(bus.results)
         sys.exit(1)
 
-    # Job 2: Build check
-    all_results.extend(run_job_build_check())
+    # Jobs 2, 4 and 5 are independent once quality has passed. Each gets its
+    # own worker process, which hands back its results and captured output.
+    # The pool is sized per job rather than per core: the workers mostly wait
+    # on their child processes.
+    parallel_jobs = [run_job_build_check, run_job_tests, run_job_security]
+    with ProcessPoolExecutor(max_workers=len(parallel_jobs)) as executor:
+        asyncio.run(run_concurrently(parallel_jobs, executor, on_done=bus.publish))
 
-    all_results.extend(run_job_deploy_preflight())
+    bus.publish(run_job_deploy_preflight())
 
     # Job 3: Prebuild & Native build
     if not args.quick and not args.skip_prebuild:
-        all_results.extend(run_job_prebuild())
+        bus.publish(run_job_prebuild())
     else:
         skip("Skipping prebuild/native build (--quick or --skip-prebuild)")
-        all_results.append(StepResult("Prebuild", Status.SKIP, "Skipped via flag"))
-
-    # Job 4: Unit tests
-    all_results.extend(run_job_tests())
-
-    # Job 5: Security
-    all_results.extend(run_job_security())
+        bus.publish([StepResult("Prebuild", Status.SKIP, "Skipped via flag")])
 
     # Job 6: E2E (optional)
-    if args.e2e:
-        all_results.extend(run_job_e2e())
+    if args.e2e or args.e2e_shard:
+        bus.publish(run_job_e2e(args.e2e_shard))
     else:
         skip("Skipping E2E tests (use --e2e to include)")
-        all_results.append(StepResult("E2E tests", Status.SKIP, "Use --e2e flag"))
+        bus.publish([StepResult("E2E tests", Status.SKIP, "Use --e2e flag")])
 
     # Summary
-    passed = print_summary(all_results)
+    passed = print_summary(bus.results)
     sys.exit(0 if passed else 1)
 
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    except KeyboardInterrupt:
+        # Commands run in their own process groups, out of reach of Ctrl-C
+        cancel_running_commands()
+        sys.exit(130)
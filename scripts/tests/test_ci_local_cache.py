@@ -0,0 +1,89 @@
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import ci_local  # noqa: E402
+
+
+class TestCiLocalCache(unittest.TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.root = Path(tmp_dir.name)
+
+        self.recorded = []
+
+        def fake_run(cmd, **kwargs):
+            self.recorded.append(cmd)
+            return (True, "")
+
+        for name, value in (
+            ("ROOT", self.root),
+            ("CACHE_DIR", self.root / ".ci-cache"),
+            ("run", mock.Mock(side_effect=fake_run)),
+        ):
+            patcher = mock.patch.object(ci_local, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_cache_hit_requires_matching_stamp(self):
+        self.assertFalse(ci_local.cache_hit("step", "abc"))
+        ci_local.cache_store("step", "abc")
+        self.assertTrue(ci_local.cache_hit("step", "abc"))
+        self.assertFalse(ci_local.cache_hit("step", "def"))
+
+    def test_bun_install_skipped_until_lockfile_changes(self):
+        (self.root / "package.json").write_text("{}")
+        (self.root / "bun.lock").write_text("lock-v1")
+        (self.root / "node_modules").mkdir()
+
+        first = ci_local._bun_install_if_stale()
+        second = ci_local._bun_install_if_stale()
+        (self.root / "bun.lock").write_text("lock-v2")
+        third = ci_local._bun_install_if_stale()
+
+        self.assertEqual(first.status, ci_local.Status.PASS)
+        self.assertEqual(second.status, ci_local.Status.SKIP)
+        self.assertEqual(third.status, ci_local.Status.PASS)
+        self.assertEqual(self.recorded, [["bun", "install"], ["bun", "install"]])
+
+    def test_eas_config_skipped_until_eas_json_changes(self):
+        (self.root / "eas.json").write_text('{"build": {}}')
+
+        first = ci_local.run_job_build_check()
+        second = ci_local.run_job_build_check()
+        (self.root / "eas.json").write_text('{"build": {"preview": {}}}')
+        third = ci_local.run_job_build_check()
+
+        statuses = [results[0].status for results in (first, second, third)]
+        Status = ci_local.Status
+        self.assertEqual(statuses, [Status.PASS, Status.SKIP, Status.PASS])
+        self.assertEqual(len(self.recorded), 4)
+
+    def test_check_skipped_until_inputs_change(self):
+        subprocess.run(["git", "init", "-q"], cwd=self.root, check=True)
+        source = self.root / "app.ts"
+        source.write_text("export const a = 1;\n")
+        calls = []
+
+        def check():
+            calls.append(source.read_text())
+            return [ci_local.StepResult("TypeScript", ci_local.Status.PASS)]
+
+        run_if_changed = ci_local.run_if_changed
+        run_if_changed("typescript", "TypeScript", ["*.ts"], check)
+        skipped = run_if_changed("typescript", "TypeScript", ["*.ts"], check)
+        source.write_text("export const a = 2;\n")
+        run_if_changed("typescript", "TypeScript", ["*.ts"], check)
+
+        self.assertEqual(skipped[0].status, ci_local.Status.SKIP)
+        self.assertEqual(len(calls), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import ci_local  # noqa: E402
+
+# Built at runtime so this file never trips the scan itself
+CONFLICT = "\n".join(["<" * 7 + " HEAD", "a", "=" * 7, "b", ">" * 7 + " branch", ""])
+
+
+class TestCiLocalConflictMarkers(unittest.TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.root = Path(tmp_dir.name)
+        patcher = mock.patch.object(ci_local, "ROOT", self.root)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def status(self):
+        return ci_local.run_job_conflict_markers()[0]
+
+    def test_git_checkout(self):
+        subprocess.run(["git", "init", "-q"], cwd=self.root, check=True)
+        (self.root / "clean.ts").write_text("export const a = 1;\n")
+        self.assertEqual(self.status().status, ci_local.Status.PASS)
+
+        (self.root / "conflicted.ts").write_text(CONFLICT)
+        self.assertEqual(self.status().status, ci_local.Status.FAIL)
+
+    def test_git_checkout_non_ascii_path(self):
+        subprocess.run(["git", "init", "-q"], cwd=self.root, check=True)
+        (self.root / "café.ts").write_text(CONFLICT)
+
+        self.assertEqual(self.status().status, ci_local.Status.FAIL)
+
+    def test_listed_files_fail_even_without_detail_lines(self):
+        (self.root / ".git").mkdir()
+        with mock.patch.object(
+            ci_local, "run_search", side_effect=[(0, ["a.ts"], ""), (1, [], "")]
+        ):
+            self.assertEqual(self.status().status, ci_local.Status.FAIL)
+
+    def test_grep_fallback(self):
+        (self.root / "clean.ts").write_text("export const a = 1;\n")
+        with mock.patch.object(ci_local, "check_tool", return_value=False):
+            self.assertEqual(self.status().status, ci_local.Status.PASS)
+
+            (self.root / "conflicted.ts").write_text(CONFLICT)
+            self.assertEqual(self.status().status, ci_local.Status.FAIL)
+
+    def test_scan_error_is_not_reported_as_conflict(self):
+        (self.root / ".git").mkdir()  # Not a repository: git grep exits 128
+
+        result = self.status()
+
+        self.assertEqual(result.status, ci_local.Status.WARN)
+        self.assertEqual(result.message, "Scan failed")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,31 +1,26 @@
-import importlib.util
+import sys
+import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-def load_ci_local_module():
-    module_path = Path(__file__).resolve().parents[1] / "ci_local.py"
-    spec = importlib.util.spec_from_file_location("ci_local", module_path)
-    if spec is None or spec.loader is None:
-        raise RuntimeError(f"Failed to load module spec for {module_path}")
-
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
+import ci_local  # noqa: E402
 
 
 class TestCiLocalDepcheck(unittest.TestCase):
     def test_depcheck_uses_no_install_and_short_timeout(self):
-        ci_local = load_ci_local_module()
-
         recorded = []
 
-        def fake_run(cmd, cwd=None, check=True, capture=False, timeout=600):
+        def fake_run(cmd, timeout=600, **kwargs):
             recorded.append((cmd, timeout))
             return (True, "")
 
-        ci_local.run = fake_run
-        ci_local.run_job_quality()
+        with tempfile.TemporaryDirectory() as cache_dir, mock.patch.object(
+            ci_local, "CACHE_DIR", Path(cache_dir)
+        ), mock.patch.object(ci_local, "run", side_effect=fake_run):
+            ci_local.run_job_quality()
 
         depcheck_calls = [(cmd, timeout) for cmd, timeout in recorded if "depcheck" in cmd]
         self.assertTrue(depcheck_calls, "Expected run_job_quality() to invoke depcheck")
@@ -0,0 +1,109 @@
+import asyncio
+import contextlib
+import io
+import re
+import sys
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import ci_local  # noqa: E402
+
+
+class TestCiLocalRun(unittest.TestCase):
+    def test_capture_returns_status_and_merged_output(self):
+        ok, output = ci_local.run(["sh", "-c", "echo out; echo err >&2; exit 3"], capture=True)
+
+        self.assertFalse(ok)
+        self.assertEqual(output.splitlines(), ["out", "err"])
+
+    def test_missing_tool_is_reported(self):
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            ok, _ = ci_local.run(["definitely-not-a-ci-tool"])
+
+        self.assertFalse(ok)
+        self.assertIn("No such file or directory", stdout.getvalue())
+
+    def test_undecodable_output_is_replaced(self):
+        ok, output = ci_local.run(["printf", "bad \\377 byte\\n"], capture=True)
+
+        self.assertTrue(ok)
+        self.assertEqual(output, "bad \ufffd byte\n")
+
+    def test_capture_keeps_only_the_tail(self):
+        total = ci_local._CAPTURE_MAX_LINES + 500
+        ok, output = ci_local.run(["seq", str(total)], capture=True)
+
+        lines = output.splitlines()
+        self.assertTrue(ok)
+        self.assertEqual(len(lines), ci_local._CAPTURE_MAX_LINES)
+        self.assertEqual(lines[-1], str(total))
+
+    def test_stop_on_ends_the_command_early(self):
+        start = time.monotonic()
+        ok, output = ci_local.run(
+            ["sh", "-c", "echo ready; echo 'error: ConnectionRefused'; sleep 10; echo late"],
+            capture=True,
+            stop_on=re.compile("ConnectionRefused"),
+        )
+
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertFalse(ok)
+        self.assertNotIn("late", output)
+
+    def test_audit_stops_only_on_error_shaped_transient_lines(self):
+        pattern = ci_local._TRANSIENT_ERROR_LINE_RE
+        for line in ["error: ConnectionRefused", "ETIMEDOUT connect 10.0.0.1"]:
+            with self.subTest(line=line):
+                self.assertTrue(pattern.search(line))
+        for line in ["socket-timeout  <=1.2  critical  ReDoS", "Express timeout middleware"]:
+            with self.subTest(line=line):
+                self.assertIsNone(pattern.search(line))
+
+    def test_timeout_also_kills_grandchildren_holding_the_pipe(self):
+        start = time.monotonic()
+        ok, output = ci_local.run(
+            ["sh", "-c", "sleep 10 & echo hi; sleep 10"], capture=True, timeout=1
+        )
+
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertEqual((ok, output), (False, "Command timed out"))
+
+    def test_run_piped_timeout_kills_the_producer_group(self):
+        start = time.monotonic()
+        ok, output = ci_local.run_piped(
+            ["sh", "-c", "sleep 10 & sleep 10"], ["cat"], timeout=1
+        )
+
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertEqual((ok, output), (False, "Command timed out"))
+
+
+class TestRunConcurrently(unittest.TestCase):
+    def test_fail_fast_kills_siblings_and_resets_cancellation(self):
+        Status = ci_local.Status
+
+        def slow_check():
+            ok, _ = ci_local.run(["sh", "-c", "sleep 6; true"])
+            return [ci_local.StepResult("Slow", Status.PASS if ok else Status.FAIL)]
+
+        def failing_check():
+            time.sleep(0.5)
+            return [ci_local.StepResult("Failing", Status.FAIL)]
+
+        start = time.monotonic()
+        outcomes = asyncio.run(
+            ci_local.run_concurrently([slow_check, failing_check], fail_fast=True)
+        )
+
+        self.assertLess(time.monotonic() - start, 3)
+        self.assertIsNone(outcomes[0])
+        self.assertEqual(outcomes[1][0].status, Status.FAIL)
+        self.assertEqual(ci_local.run(["true"]), (True, ""))
+
+
+if __name__ == "__main__":
+    unittest.main()
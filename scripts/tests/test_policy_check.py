@@ -0,0 +1,98 @@
+import importlib.util
+import tempfile
+import unittest
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+FIXTURES_DIR = REPO_ROOT / "scripts" / "ci" / "fixtures"
+
+
+def load_policy_check_module():
+    module_path = REPO_ROOT / "scripts" / "ci" / "policy_check.py"
+    spec = importlib.util.spec_from_file_location("policy_check", module_path)
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"Failed to load module spec for {module_path}")
+
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestPolicyCheck(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.policy_check = load_policy_check_module()
+
+    def write_workflow(self, name, content):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        path = Path(tmp_dir.name) / name
+        path.write_text(content, encoding="utf-8")
+        return path
+
+    def test_repo_workflows_pass(self):
+        files = self.policy_check._default_workflow_files(REPO_ROOT)
+        self.assertTrue(files, "Expected workflow files under .github/workflows")
+        self.assertEqual(self.policy_check.run_policy_check(files), [])
+
+    def test_fixtures_report_violations(self):
+        expectations = {
+            "workflow-bad-floating-ref.yml": "floating ref is forbidden",
+            "workflow-bad-main-ref.yml": "floating ref is forbidden",
+            "workflow-bad-top-level-write.yml": "top-level permissions contains write scope",
+        }
+        for fixture, expected in expectations.items():
+            with self.subTest(fixture=fixture):
+                violations = self.policy_check.run_policy_check([FIXTURES_DIR / fixture])
+                self.assertTrue(
+                    any(expected in item for item in violations),
+                    f"Expected '{expected}' in {violations}",
+                )
+
+    def test_latest_expo_version_is_forbidden(self):
+        path = self.write_workflow(
+            "setup.yml",
+            "jobs:\n"
+            "  build:\n"
+            "    steps:\n"
+            "      - uses: expo/expo-github-action@v8\n"
+            "        with:\n"
+            "          eas-version: latest\n",
+        )
+        violations = self.policy_check.run_policy_check([path])
+        self.assertEqual(len(violations), 1, violations)
+        self.assertIn("latest expo/eas version is forbidden", violations[0])
+
+    def test_commented_top_level_write_scope_is_ignored(self):
+        path = self.write_workflow(
+            "comments.yml",
+            "permissions:\n"
+            "  contents: read\n"
+            "  # pull-requests: write\n"
+            "  issues: write\n",
+        )
+        violations = self.policy_check.run_policy_check([path])
+        self.assertEqual(len(violations), 1, violations)
+        self.assertIn("(issues: write)", violations[0])
+
+    def test_deploy_jobs_must_need_security(self):
+        path = self.write_workflow(
+            "ci-cd.yml",
+            "jobs:\n"
+            "  security:\n"
+            "    runs-on: ubuntu-latest\n"
+            "  deploy-staging:\n"
+            "    needs: [quality, security]\n"
+            "  deploy-production:\n"
+            "    needs:\n"
+            "      - quality\n"
+            "      - build-check\n",
+        )
+        violations = self.policy_check.run_policy_check([path])
+        self.assertEqual(len(violations), 1, violations)
+        self.assertIn("job 'deploy-production' must depend on 'security'", violations[0])
+
+
+if __name__ == "__main__":
+    unittest.main()